@@ -1,6 +1,7 @@
 import os
 import sys
 import stat
+import shutil
 from pathlib import Path
 
 SCRIPT_NAME = "main.py"
@@ -11,18 +12,23 @@ SHEBANG = "#!/usr/bin/env python3"
 def add_shebang():
     print(f"[*] Checking for shebang in {SCRIPT_NAME}...")
     try:
-        with open(SCRIPT_NAME, 'r+') as f:
-            content = f.read()
-            if not content.startswith(SHEBANG):
-                f.seek(0)
-                f.write(SHEBANG + '\n' + content)
-                print("    -> Shebang added.")
-            else:
+        with open(SCRIPT_NAME, 'rb') as f:
+            first_line = f.readline()
+            if first_line.startswith(SHEBANG.encode()):
                 print("    -> Shebang already exists.")
+                return
+            content = first_line + f.read()
     except FileNotFoundError:
         print(f"Error: {SCRIPT_NAME} not found. Make sure you are in the project root directory.")
         sys.exit(1)
 
+    tmp_name = SCRIPT_NAME + ".tmp"
+    with open(tmp_name, 'wb') as f:
+        f.write(SHEBANG.encode() + b'\n' + content)
+    shutil.copymode(SCRIPT_NAME, tmp_name)
+    os.replace(tmp_name, SCRIPT_NAME)
+    print("    -> Shebang added.")
+
 
 def make_executable():
     print(f"[*] Making {SCRIPT_NAME} executable...")
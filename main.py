@@ -1,26 +1,25 @@
 #!/usr/bin/env python3
-import argparse
 import sys
 import os
-import asyncio
 import time
-import tldextract
 import re
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
 real_script_path = Path(os.path.realpath(__file__))
 project_root = real_script_path.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
 
-from src.core import SubdomainFuzzer
 from src.ui import display_art, gradient_text, print_report_box
 from src.utils import save_results, validate_domain
-from src.updater import update_command
-from src.zone_transfer import check_zone_transfer_vulnerability
-from src.takeover import check_subdomain_takeover
-from src.resolver import get_ip_address
+
+COMMON_TLDS = frozenset({
+    "com", "net", "org", "io", "co", "dev", "app", "ai", "me", "info",
+    "biz", "xyz", "tech", "fr", "de", "nl", "be", "ch", "it", "es",
+    "eu", "us", "ca", "ru", "pl", "se", "no", "fi", "dk", "cz",
+})
+
+SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+\-.]*://")
 
 def normalize_target(raw: str) -> str:
     if not raw:
@@ -28,7 +27,7 @@ def normalize_target(raw: str) -> str:
 
     raw = raw.strip()
 
-    if re.match(r"^[a-zA-Z][a-zA-Z0-9+\-.]*://", raw) or "/" in raw:
+    if SCHEME_RE.match(raw) or "/" in raw:
         parsed = urlparse(raw if "://" in raw else "http://" + raw)
         hostname = parsed.hostname or raw
     else:
@@ -40,25 +39,32 @@ def normalize_target(raw: str) -> str:
 
     hostname = hostname.rstrip(".")
 
-    ext = tldextract.extract(hostname)
+    if hostname.count(".") == 1 and hostname.rsplit(".", 1)[1] in COMMON_TLDS:
+        return hostname
+
+    import tldextract
+    extract = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+    ext = extract(hostname)
     if ext.domain and ext.suffix:
         return f"{ext.domain}.{ext.suffix}"
 
     candidate = hostname.lstrip("www.")
     return candidate
 
+@lru_cache(maxsize=1)
 def get_current_version():
-    version_file = project_root / "version.txt"
     try:
-        if version_file.exists():
-            return version_file.read_text().strip()
+        return (project_root / "version.txt").read_text().strip()
+    except FileNotFoundError:
         return "unknown"
-    except Exception as e:
+    except OSError as e:
         print(f"Warning: Could not read version file: {e}", file=sys.stderr)
         return "unknown"
 
 
-async def main():
+def build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="SubLing: An asynchronous subdomain fuzzing tool.",
         formatter_class=argparse.RawTextHelpFormatter
@@ -125,7 +131,27 @@ async def main():
         action="store_true",
         help="Check for updates and apply them"
     )
-    
+    return parser
+
+
+def handle_fast_paths(argv) -> bool:
+    if "-h" in argv or "--help" in argv:
+        return False
+
+    if "--version" in argv:
+        print(f"🕷️  SubLing version: {gradient_text(get_current_version())}")
+        return True
+
+    if "--update" in argv:
+        from src.updater import update_command
+        update_command(project_root)
+        return True
+
+    return False
+
+
+async def main():
+    parser = build_parser()
     args = parser.parse_args()
     current_version = get_current_version()
 
@@ -134,6 +160,7 @@ async def main():
         sys.exit(0)
 
     if args.update:
+        from src.updater import update_command
         update_command(project_root)
         sys.exit(0)
     
@@ -173,17 +200,20 @@ async def main():
     
     zone_transfer_subdomains = None
     if args.transfer:
+        from src.zone_transfer import check_zone_transfer_vulnerability
         zone_transfer_subdomains = await check_zone_transfer_vulnerability(domain, args.timeout)
     
     if zone_transfer_subdomains:
         print(gradient_text(f"✨ Found {len(zone_transfer_subdomains)} subdomains via zone transfer!"))
         
-        found_subdomains = {}
-        for subdomain in sorted(zone_transfer_subdomains):
-            found_subdomains[subdomain] = (None, None, None, None)
+        found_subdomains = [
+            (subdomain, None, None, None, None)
+            for subdomain in sorted(zone_transfer_subdomains)
+        ]
         
         if args.takeover:
-            takeover_subdomains = {k: (v[0], v[1]) for k, v in found_subdomains.items()}
+            from src.takeover import check_subdomain_takeover
+            takeover_subdomains = {sub: (proto, status) for sub, proto, status, _, _ in found_subdomains}
             await check_subdomain_takeover(takeover_subdomains, args.timeout, args.concurrency)
         
         if args.output:
@@ -199,13 +229,15 @@ async def main():
     
     print(gradient_text("🔎 Starting subdomain fuzzing...\n"))
     
+    from src.core import SubdomainFuzzer
     fuzzer = SubdomainFuzzer(
         domain=domain,
         wordlist=args.wordlist,
         workers=args.concurrency,
         timeout=args.timeout,
         dns_only=args.dns_only,
-        http_only=args.http_only
+        http_only=args.http_only,
+        output=args.output
     )
     
     start = time.time()
@@ -214,21 +246,33 @@ async def main():
     
     print(gradient_text(f"\n✨ Fuzzing completed in {end - start:.2f} seconds."))
     
-    if args.takeover and fuzzer.found_subdomains:
-        takeover_subdomains = {k: (v[0], v[1]) for k, v in fuzzer.found_subdomains.items()}
+    found_subdomains = fuzzer.found_subdomains
+    
+    if args.takeover and found_subdomains:
+        from src.takeover import check_subdomain_takeover
+        takeover_subdomains = {sub: (proto, status) for sub, (proto, status, _, _) in found_subdomains.items()}
         await check_subdomain_takeover(takeover_subdomains, args.timeout, args.concurrency)
     
-    if args.output and fuzzer.found_subdomains:
-        print(f"💾 Saving results to {args.output}...")
-        try:
-            save_results(args.output, fuzzer.found_subdomains)
-            print(gradient_text("✅ Results saved successfully!"))
-        except IOError as e:
-            print(gradient_text(f"❌ {e}"))
+    if args.output and found_subdomains and not fuzzer.output_failed:
+        print(gradient_text(f"💾 Results saved to {args.output}"))
 
 
-if __name__ == "__main__":
+def cli():
+    if handle_fast_paths(sys.argv[1:]):
+        sys.exit(0)
+
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        import asyncio
+        run = asyncio.run
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
-        print(gradient_text("\n🛑 Fuzzing cancelled by user. Exiting."))
\ No newline at end of file
+        print(gradient_text("\n🛑 Fuzzing cancelled by user. Exiting."))
+
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file
@@ -1,22 +1,47 @@
 import asyncio
+import sys
 import time
-from typing import Dict, Optional, Tuple
-import aiohttp
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, TextIO, Tuple
 
-from .resolver import check_dns, check_http, get_ip_address, get_content_size
-from .utils import load_wordlist
+from .resolver import (
+    check_dns,
+    check_http,
+    create_http_resolver,
+    detect_wildcard,
+    fingerprint_wildcard,
+    get_content_size,
+    has_aiodns,
+    resolve_ipv4,
+    set_dns_executor,
+)
+from .utils import format_result, load_wordlist, save_results
 from .ui import (
     print_progress_bar,
     gradient_text,
-    whole_line,
+    clear_line,
     colorize_status,
     colored_text,
     format_bytes,
     LIGHT_BLUE,
+    BLUE,
     DARK_BLUE,
     GREY,
 )
 
+if TYPE_CHECKING:
+    import aiohttp
+
+PROGRESS_INTERVAL = 0.1
+
+
+class FoundRec(NamedTuple):
+    subdomain: str
+    proto: Optional[str]
+    status: Optional[int]
+    ip: Optional[str]
+    size: Optional[int]
+
 
 class SubdomainFuzzer:
     
@@ -28,22 +53,46 @@ class SubdomainFuzzer:
         timeout: int = 5,
         dns_only: bool = False,
         http_only: bool = False,
+        dns_workers: int = 500,
+        output: Optional[str] = None,
     ):
         self.domain = domain
+        self._dot_domain = f".{domain}"
+        self._domain_colored_suffix = gradient_text(
+            self._dot_domain,
+            start_color=BLUE,
+            end_color=DARK_BLUE
+        )
         self.wordlist = wordlist
         self.workers = max(1, int(workers))
+        self.dns_workers = max(self.workers, int(dns_workers)) if has_aiodns() else self.workers
         self.timeout = timeout
         self.dns_only = dns_only
         self.http_only = http_only
+        self.output = output
+        self._out: Optional[TextIO] = None
+        self.output_failed = False
 
-        self.found_subdomains: Dict[str, Tuple[Optional[str], Optional[int], Optional[str], Optional[int]]] = {}
+        self.found_list: List[FoundRec] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._http_slots: Optional[asyncio.Semaphore] = None
+        self._wildcard_ips: Set[str] = set()
+        self._wildcard_fingerprint: Optional[Tuple[int, Optional[int]]] = None
+        self._dns_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="dns")
         self.checked_count = 0
         self.total_words = 0
         self.header_printed = False
         self.start_time = None
 
-        self.print_lock = asyncio.Lock()
-        self.status_update_interval = max(1, self.workers // 10)
+        self.display_queue: Optional[asyncio.Queue] = None
+
+    @property
+    def found_subdomains(self) -> Dict[str, Tuple[Optional[str], Optional[int], Optional[str], Optional[int]]]:
+        return {
+            found.subdomain: (found.proto, found.status, found.ip, found.size)
+            for found in self.found_list
+        }
 
     def print_header(self):
         if not self.header_printed:
@@ -53,116 +102,153 @@ class SubdomainFuzzer:
     def print_footer(self):
         print(gradient_text("-------------------------------\n"))
 
-    async def display_found(
-        self,
-        subdomain: str,
-        proto: Optional[str],
-        status: Optional[int],
-        ip: Optional[str],
-        size: Optional[int]
-    ):
-        async with self.print_lock:
-            print(f"\r{whole_line()}\r", end="")
-
-            if not self.header_printed:
-                self.print_header()
-
-            subdomain_colored = gradient_text(
-                subdomain,
-                start_color=LIGHT_BLUE,
-                end_color=DARK_BLUE
-            )
-
-            base = ""
-            if proto:
-                status_colored = colorize_status(status)
-                base = f"  {subdomain_colored} : [{proto}] {status_colored}"
-            else:
-                base = f"  {subdomain_colored} : [DNS]"
-            
-            if ip:
-                ip_colored = colored_text(ip, GREY)
-                base += f" [{ip_colored}]"
+    def format_found(self, found: FoundRec) -> bytes:
+        subdomain, proto, status, ip, size = found
+        word = subdomain[:-len(self._dot_domain)]
+        subdomain_colored = gradient_text(
+            word,
+            start_color=LIGHT_BLUE,
+            end_color=BLUE
+        ) + self._domain_colored_suffix
+
+        if proto:
+            parts = [f"  {subdomain_colored} : [{proto}] {colorize_status(status)}"]
+        else:
+            parts = [f"  {subdomain_colored} : [DNS]"]
+        
+        if ip:
+            parts.append(f" [{colored_text(ip, GREY)}]")
+        
+        if size is not None:
+            parts.append(f" [{colored_text(format_bytes(size), GREY)}]")
+        
+        parts.append("\n")
+        return "".join(parts).encode()
+
+    def display_found(self, batch: List[FoundRec]):
+        lines = b"".join(self.format_found(found) for found in batch)
+
+        clear_line()
+        if not self.header_printed:
+            self.print_header()
+        sys.stdout.flush()
+        sys.stdout.buffer.write(lines)
+        sys.stdout.buffer.flush()
+
+        if self.output and not self.output_failed:
+            try:
+                if self._out is None:
+                    self._out = open(self.output, "w", buffering=1)
+                self._out.write("".join(format_result(*found) for found in batch))
+            except OSError as e:
+                self.close_output(e)
+
+    def close_output(self, error: Optional[OSError] = None):
+        out, self._out = self._out, None
+        try:
+            if out is not None:
+                out.close()
+        except OSError as e:
+            error = error or e
+        
+        if error is not None:
+            self.output_failed = True
+            clear_line()
+            print(f"❌ Error saving results: {error}")
+
+    async def reporter(self):
+        finished = False
+        while not finished:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            batch = []
+            while not self.display_queue.empty():
+                found = self.display_queue.get_nowait()
+                if found is None:
+                    finished = True
+                    break
+                batch.append(found)
             
-            if size is not None:
-                size_formatted = format_bytes(size)
-                size_colored = colored_text(size_formatted, GREY)
-                base += f" [{size_colored}]"
+            if batch:
+                self.display_found(batch)
             
-            print(base)
+            if not finished:
+                print_progress_bar(
+                    self.checked_count,
+                    self.total_words,
+                    self.start_time
+                )
+
+    def record(self, found: FoundRec):
+        self.found_list.append(found)
+        self.display_queue.put_nowait(found)
+
+    def spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
-    async def process_worker(
+    async def process_word(
         self,
-        queue: asyncio.Queue,
-        session: aiohttp.ClientSession
+        session: "aiohttp.ClientSession",
+        subdomain: str
     ):
-        while True:
-            try:
-                word = await queue.get()
-                if word is None:
-                    queue.task_done()
-                    break
+        try:
+            if self.http_only:
+                await self.probe_http(session, subdomain, None)
+                return
+            addresses = await resolve_ipv4(subdomain, self.timeout)
+        except Exception:
+            return
+        finally:
+            self.checked_count += 1
+            self._slots.release()
 
-                subdomain = f"{word.strip()}.{self.domain}"
-                self.checked_count += 1
+        if not addresses:
+            return
+        if self._wildcard_ips.issuperset(addresses) and (self.dns_only or self._wildcard_fingerprint is None):
+            return
+        ip = addresses[0]
 
-                if (self.checked_count % self.status_update_interval) == 0 or self.checked_count == 1:
-                    async with self.print_lock:
-                        print_progress_bar(
-                            self.checked_count,
-                            self.total_words,
-                            self.start_time
-                        )
+        if self.dns_only:
+            self.record(FoundRec(subdomain, None, None, ip, None))
+        else:
+            on_wildcard = not self._wildcard_ips.isdisjoint(addresses)
+            self.spawn(self.probe_http(session, subdomain, ip, on_wildcard))
 
-                ip = None
-                size = None
-                
-                try:
+    async def probe_http(
+        self,
+        session: "aiohttp.ClientSession",
+        subdomain: str,
+        ip: Optional[str],
+        on_wildcard: bool = False
+    ):
+        try:
+            async with self._http_slots:
+                result = await check_http(session, subdomain)
+                if result:
+                    proto, status, size = result
                     if self.http_only:
-                        result = await check_http(session, subdomain, self.timeout)
-                        if result:
-                            proto, status, size = result
-                            ip = await get_ip_address(subdomain, self.timeout)
-                            
-                            if size is None:
-                                size = await get_content_size(session, subdomain, proto, self.timeout)
-                            
-                            self.found_subdomains[subdomain] = (proto, status, ip, size)
-                            await self.display_found(subdomain, proto, status, ip, size)
-                    else:
-                        dns_exists = await check_dns(subdomain, self.timeout)
-                        if dns_exists:
-                            ip = await get_ip_address(subdomain, self.timeout)
-                            if self.dns_only:
-                                self.found_subdomains[subdomain] = (None, None, ip, None)
-                                await self.display_found(subdomain, None, None, ip, None)
-                            else:
-                                result = await check_http(session, subdomain, self.timeout)
-                                if result:
-                                    proto, status, size = result
-                                    
-                                    if size is None:
-                                        size = await get_content_size(session, subdomain, proto, self.timeout)
-                                    
-                                    self.found_subdomains[subdomain] = (proto, status, ip, size)
-                                    await self.display_found(subdomain, proto, status, ip, size)
-                                else:
-                                    self.found_subdomains[subdomain] = (None, None, ip, None)
-                                    await self.display_found(subdomain, None, None, ip, None)
-                except Exception:
-                    pass
-                finally:
-                    queue.task_done()
+                        ip = await check_dns(subdomain, self.timeout)
+                    
+                    if size is None:
+                        size = await get_content_size(session, subdomain, proto, self.timeout)
+                    
+                    if on_wildcard and (status, size) == self._wildcard_fingerprint:
+                        return
                     
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                queue.task_done()
-                break
+                    self.record(FoundRec(subdomain, proto, status, ip, size))
+                elif not self.http_only and not on_wildcard:
+                    self.record(FoundRec(subdomain, None, None, ip, None))
+        except Exception:
+            pass
 
     async def run(self):
+        import ssl
+        import aiohttp
+
         try:
-            words = load_wordlist(self.wordlist)
+            total_words, words = load_wordlist(self.wordlist)
         except FileNotFoundError as e:
             print(f"❌ {e}")
             return
@@ -170,41 +256,86 @@ class SubdomainFuzzer:
             print(f"❌ {e}")
             return
 
-        self.total_words = len(words)
+        set_dns_executor(self._dns_executor)
+
+        if not self.http_only:
+            self._wildcard_ips = await detect_wildcard(self.domain, self.timeout)
+            if self._wildcard_ips:
+                ips = ", ".join(sorted(self._wildcard_ips))
+                print(gradient_text(f"⚠️  Wildcard DNS detected ({ips}), filtering subdomains resolving to it."))
+
+        self.total_words = total_words
         self.start_time = time.time()
 
-        connector = aiohttp.TCPConnector(limit=self.workers, ssl=False)
-        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
 
-        queue = asyncio.Queue(maxsize=self.workers * 2)
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.workers,
+            ssl=ssl_context,
+            resolver=create_http_resolver(),
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+            force_close=False,
+        )
+        timeout_config = aiohttp.ClientTimeout(total=self.timeout)
+        dispatched = 0
+        completed = False
 
         async with aiohttp.ClientSession(
             connector=connector,
             timeout=timeout_config
         ) as session:
-            workers = [
-                asyncio.create_task(self.process_worker(queue, session))
-                for _ in range(self.workers)
-            ]
+            self.display_queue = asyncio.Queue()
+            reporter_task = asyncio.create_task(self.reporter())
+            self._slots = asyncio.Semaphore(self.workers if self.http_only else self.dns_workers)
+            self._http_slots = asyncio.Semaphore(self.workers)
+
+            if self._wildcard_ips and not self.dns_only:
+                self._wildcard_fingerprint = await fingerprint_wildcard(session, self.domain, self.timeout)
 
             try:
                 for word in words:
-                    await queue.put(word)
+                    await self._slots.acquire()
+                    self.spawn(self.process_word(session, word + self._dot_domain))
+                    dispatched += 1
+                self.total_words = dispatched
 
-                for _ in range(self.workers):
-                    await queue.put(None)
-
-                await queue.join()
+                while self._tasks:
+                    await asyncio.gather(*self._tasks)
+                self.display_queue.put_nowait(None)
+                await reporter_task
+                completed = True
                 
             except KeyboardInterrupt:
                 pass
             finally:
-                for task in workers:
+                pending = [*self._tasks, reporter_task]
+                for task in pending:
                     if not task.done():
                         task.cancel()
                 
-                await asyncio.gather(*workers, return_exceptions=True)
+                await asyncio.gather(*pending, return_exceptions=True)
+                words.close()
+                if self._out is not None:
+                    self.close_output()
+                set_dns_executor(None)
+                self._dns_executor.shutdown(wait=False)
 
-        print(f"\r{whole_line()}\r", end="")
+        clear_line()
         if self.header_printed:
-            self.print_footer()
\ No newline at end of file
+            self.print_footer()
+        
+        if not dispatched:
+            print(f"❌ Wordlist is empty: {self.wordlist}")
+        
+        if completed and self.found_list and self.output and not self.output_failed:
+            try:
+                save_results(self.output, self.found_list)
+            except IOError as e:
+                self.output_failed = True
+                print(f"❌ {e}")
\ No newline at end of file
@@ -1,107 +1,247 @@
 import asyncio
+import importlib.util
+import secrets
 import socket
-from typing import Optional, Tuple
-import aiohttp
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
+if TYPE_CHECKING:
+    import aiohttp
 
-async def get_ip_address(subdomain: str, timeout: int = 5) -> Optional[str]:
-    try:
-        loop = asyncio.get_event_loop()
+
+_dns_resolver = None
+_dns_resolver_key = None
+_dns_executor: Optional[ThreadPoolExecutor] = None
+
+DNS_CACHE_SIZE = 4096
+_dns_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+
+BODY_CHUNK_SIZE = 8192
+HEAD_FALLBACK_STATUSES = frozenset({403, 404, 405, 501})
+
+
+@lru_cache(maxsize=1)
+def has_aiodns() -> bool:
+    return importlib.util.find_spec("aiodns") is not None
+
+
+def set_dns_executor(executor: Optional[ThreadPoolExecutor]):
+    global _dns_executor
+    _dns_executor = executor
+
+
+def get_dns_resolver(timeout: int = 5):
+    global _dns_resolver, _dns_resolver_key
+
+    loop = asyncio.get_running_loop()
+    if _dns_resolver is None or _dns_resolver_key != (loop, timeout):
+        import aiodns
+        _dns_resolver = aiodns.DNSResolver(loop=loop, timeout=timeout)
+        _dns_resolver_key = (loop, timeout)
+    return _dns_resolver
+
+
+async def lookup_ipv4(subdomain: str, timeout: int = 5) -> List[str]:
+    if has_aiodns():
         result = await asyncio.wait_for(
-            loop.run_in_executor(
-                None,
-                socket.getaddrinfo,
-                subdomain,
-                None,
-                socket.AF_INET
-            ),
+            get_dns_resolver(timeout).gethostbyname(subdomain, socket.AF_INET),
             timeout=timeout
         )
-        if result:
-            return result[0][4][0]
-        return None
-    except (socket.gaierror, asyncio.TimeoutError, Exception):
-        return None
+        return list(result.addresses)
 
+    infos = await asyncio.wait_for(
+        asyncio.get_running_loop().run_in_executor(
+            _dns_executor,
+            socket.getaddrinfo,
+            subdomain,
+            None,
+            socket.AF_INET,
+            socket.SOCK_STREAM
+        ),
+        timeout=timeout
+    )
+    return list(dict.fromkeys(info[4][0] for info in infos))
 
-async def check_dns(subdomain: str, timeout: int = 5) -> bool:
-    try:
-        loop = asyncio.get_event_loop()
-        result = await asyncio.wait_for(
-            loop.run_in_executor(
-                None,
-                socket.getaddrinfo,
-                subdomain,
-                None,
-                socket.AF_INET
-            ),
+
+async def lookup_cname(subdomain: str, timeout: int = 5) -> List[str]:
+    if has_aiodns():
+        answer = await asyncio.wait_for(
+            get_dns_resolver(timeout).query(subdomain, 'CNAME'),
             timeout=timeout
         )
-        return bool(result)
-    except (socket.gaierror, asyncio.TimeoutError, Exception):
-        return False
+        return [answer.cname.rstrip('.')]
 
+    import dns.asyncresolver
+    answer = await dns.asyncresolver.resolve(subdomain, 'CNAME', lifetime=timeout)
+    return [rdata.target.to_text().rstrip('.') for rdata in answer]
 
-async def check_http(
-    session: aiohttp.ClientSession,
-    subdomain: str,
-    timeout: int = 5
-) -> Optional[Tuple[str, int, Optional[int]]]:
-    for protocol in ("https", "http"):
-        url = f"{protocol}://{subdomain}"
+
+async def resolve_ipv4(subdomain: str, timeout: int = 5) -> List[str]:
+    addresses = _dns_cache.get(subdomain)
+    if addresses is not None:
+        _dns_cache.move_to_end(subdomain)
+        return addresses
+
+    try:
+        addresses = await lookup_ipv4(subdomain, timeout)
+    except Exception:
+        return []
+
+    cache_addresses(subdomain, addresses)
+    return addresses
+
+
+def cache_addresses(hostname: str, addresses: List[str]):
+    if addresses:
+        _dns_cache[hostname] = addresses
+        if len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+
+
+async def check_dns(subdomain: str, timeout: int = 5) -> Optional[str]:
+    addresses = await resolve_ipv4(subdomain, timeout)
+    if addresses:
+        return addresses[0]
+    return None
+
+
+def create_http_resolver():
+    import aiohttp
+
+    base_resolver = aiohttp.AsyncResolver if has_aiodns() else aiohttp.ThreadedResolver
+
+    class CachedResolver(base_resolver):
+        async def resolve(self, host, port=0, family=socket.AF_INET):
+            addresses = _dns_cache.get(host)
+            if addresses and family in (socket.AF_INET, socket.AF_UNSPEC):
+                return [
+                    {
+                        "hostname": host,
+                        "host": address,
+                        "port": port,
+                        "family": socket.AF_INET,
+                        "proto": 0,
+                        "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+                    }
+                    for address in addresses
+                ]
+            results = await super().resolve(host, port, family)
+            cache_addresses(host, [r["host"] for r in results if r["family"] == socket.AF_INET])
+            return results
+
+    return CachedResolver()
+
+
+async def detect_wildcard(domain: str, timeout: int = 5, probes: int = 5) -> Set[str]:
+    results = await asyncio.gather(*(
+        resolve_ipv4(f"{secrets.token_hex(8)}.{domain}", timeout)
+        for _ in range(probes)
+    ))
+    if all(results):
+        return {ip for addresses in results for ip in addresses}
+    return set()
+
+
+def parse_content_length(response: "aiohttp.ClientResponse") -> Optional[int]:
+    content_length = response.headers.get('Content-Length')
+    if content_length:
         try:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-                ssl=False,
-                allow_redirects=True,
-            ) as response:
-                size = None
-                content_length = response.headers.get('Content-Length')
-                if content_length:
-                    try:
-                        size = int(content_length)
-                    except ValueError:
-                        pass
-                
-                return (protocol, response.status, size)
-        except (aiohttp.ClientError, asyncio.TimeoutError):
-            continue
-        except Exception:
-            continue
+            return int(content_length)
+        except ValueError:
+            pass
     return None
 
 
+async def probe_protocol(
+    session: "aiohttp.ClientSession",
+    subdomain: str,
+    protocol: str
+) -> Optional[Tuple[str, int, Optional[int]]]:
+    import aiohttp
+
+    url = f"{protocol}://{subdomain}"
+    try:
+        async with session.head(url, allow_redirects=False) as response:
+            status = response.status
+            size = parse_content_length(response)
+
+        if status in HEAD_FALLBACK_STATUSES:
+            async with session.get(url, allow_redirects=False) as response:
+                status = response.status
+                size = parse_content_length(response)
+
+        return (protocol, status, size)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+    except Exception:
+        return None
+
+
+async def check_http(
+    session: "aiohttp.ClientSession",
+    subdomain: str
+) -> Optional[Tuple[str, int, Optional[int]]]:
+    https_task = asyncio.ensure_future(probe_protocol(session, subdomain, "https"))
+    http_task = asyncio.ensure_future(probe_protocol(session, subdomain, "http"))
+    try:
+        result = await https_task
+        if result:
+            return result
+        return await http_task
+    finally:
+        for task in (https_task, http_task):
+            if not task.done():
+                task.cancel()
+
+
+async def count_body_bytes(response: "aiohttp.ClientResponse") -> int:
+    size = 0
+    async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+        size += len(chunk)
+    return size
+
+
 async def get_content_size(
-    session: aiohttp.ClientSession,
+    session: "aiohttp.ClientSession",
     subdomain: str,
     protocol: str,
     timeout: int = 5
 ) -> Optional[int]:
+    import aiohttp
+
     url = f"{protocol}://{subdomain}"
     try:
-        async with session.get(
-            url,
-            timeout=aiohttp.ClientTimeout(total=timeout),
-            ssl=False,
-            allow_redirects=True,
-        ) as response:
-            content_length = response.headers.get('Content-Length')
-            if content_length:
-                try:
-                    return int(content_length)
-                except ValueError:
-                    pass
+        async with session.get(url, allow_redirects=False) as response:
+            size = parse_content_length(response)
+            if size is not None:
+                return size
             
             try:
-                content = await asyncio.wait_for(
-                    response.read(),
+                return await asyncio.wait_for(
+                    count_body_bytes(response),
                     timeout=min(timeout, 3)
                 )
-                return len(content)
             except asyncio.TimeoutError:
                 return None
     except (aiohttp.ClientError, asyncio.TimeoutError):
         return None
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+async def fingerprint_wildcard(
+    session: "aiohttp.ClientSession",
+    domain: str,
+    timeout: int = 5
+) -> Optional[Tuple[int, Optional[int]]]:
+    subdomain = f"{secrets.token_hex(8)}.{domain}"
+    result = await check_http(session, subdomain)
+    if not result:
+        return None
+
+    protocol, status, size = result
+    if size is None:
+        size = await get_content_size(session, subdomain, protocol, timeout)
+    return (status, size)
@@ -1,11 +1,15 @@
 import asyncio
 import aiohttp
-import dns.resolver
 import json
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
+from .resolver import lookup_cname
 from .ui import gradient_text, colored_text, print_report_box, GREEN, SPIDER_RED, YELLOW, LIGHT_BLUE
 
+MAX_BODY_SIZE = 64 * 1024
+BODY_CHUNK_SIZE = 8192
+
 def load_takeover_signatures():
     json_path = Path(__file__).parent.parent / "data" / "takeover_signatures.json"
     
@@ -24,6 +28,19 @@ def load_takeover_signatures():
     
     return signatures
 
+def compile_signatures(signatures: Dict[str, Dict]) -> List[Tuple[str, Tuple[str, ...], Optional[re.Pattern], str]]:
+    compiled = []
+    for service_name, signature in signatures.items():
+        sig_cnames = tuple(sig_cname.lower() for sig_cname in signature["cname"])
+        response_re = None
+        if signature["response"]:
+            response_re = re.compile(
+                "|".join(re.escape(error_string) for error_string in signature["response"]),
+                re.IGNORECASE
+            )
+        compiled.append((service_name, sig_cnames, response_re, signature["fingerprint"]))
+    return compiled
+
 class SubdomainTakeoverDetector:
     
     def __init__(self, timeout: int = 10):
@@ -31,24 +48,11 @@ class SubdomainTakeoverDetector:
         self.vulnerable_subdomains: List[Dict] = []
         self.checked_count = 0
         self.takeover_signatures = load_takeover_signatures()
+        self.compiled_signatures = compile_signatures(self.takeover_signatures)
         
     async def get_cname_records(self, subdomain: str) -> List[str]:
         try:
-            loop = asyncio.get_event_loop()
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = self.timeout
-            resolver.lifetime = self.timeout
-            
-            answers = await loop.run_in_executor(
-                None,
-                lambda: resolver.resolve(subdomain, 'CNAME')
-            )
-            
-            cnames = [str(rdata.target).rstrip('.') for rdata in answers]
-            return cnames
-            
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.NoNameservers):
-            return []
+            return await lookup_cname(subdomain, self.timeout)
         except Exception:
             return []
     
@@ -56,13 +60,13 @@ class SubdomainTakeoverDetector:
         for protocol in ("https", "http"):
             url = f"{protocol}://{subdomain}"
             try:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    ssl=False,
-                    allow_redirects=True,
-                ) as response:
-                    content = await response.text()
+                async with session.get(url, allow_redirects=True) as response:
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                        body.extend(chunk)
+                        if len(body) >= MAX_BODY_SIZE:
+                            break
+                    content = body.decode(response.charset or "utf-8", "replace")
                     return (response.status, content)
             except (aiohttp.ClientError, asyncio.TimeoutError):
                 continue
@@ -74,33 +78,28 @@ class SubdomainTakeoverDetector:
         if not cnames:
             return None
         
-        for service_name, signature in self.takeover_signatures.items():
-            cname_match = False
+        lowered_cnames = [(cname, cname.lower()) for cname in cnames]
+        
+        for service_name, sig_cnames, response_re, fingerprint in self.compiled_signatures:
             matched_cname = None
-            for cname in cnames:
-                for sig_cname in signature["cname"]:
-                    if sig_cname in cname.lower():
-                        cname_match = True
-                        matched_cname = cname
-                        break
-                if cname_match:
+            for cname, cname_lower in lowered_cnames:
+                if any(sig_cname in cname_lower for sig_cname in sig_cnames):
+                    matched_cname = cname
                     break
             
-            if not cname_match:
+            if matched_cname is None:
                 continue
             
-            if response_data:
+            if response_data and response_re is not None:
                 status, content = response_data
-                content_lower = content.lower()
                 
-                for error_string in signature["response"]:
-                    if error_string.lower() in content_lower:
-                        return {
-                            "service": service_name,
-                            "cname": matched_cname,
-                            "status": status,
-                            "fingerprint": signature["fingerprint"]
-                        }
+                if response_re.search(content):
+                    return {
+                        "service": service_name,
+                        "cname": matched_cname,
+                        "status": status,
+                        "fingerprint": fingerprint
+                    }
         
         return None
     
@@ -147,14 +146,23 @@ class SubdomainTakeoverDetector:
             connector=connector,
             timeout=timeout_config
         ) as session:
-            tasks = []
-            for subdomain in subdomains.keys():
-                task = self.check_subdomain(session, subdomain)
-                tasks.append(task)
+            semaphore = asyncio.Semaphore(workers)
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def bounded_check(subdomain: str) -> Optional[Dict]:
+                async with semaphore:
+                    return await self.check_subdomain(session, subdomain)
             
-            for result in results:
+            tasks = [
+                asyncio.create_task(bounded_check(subdomain))
+                for subdomain in subdomains.keys()
+            ]
+            
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:
+                    result = None
+                
                 self.checked_count += 1
                 if isinstance(result, dict) and result:
                     self.vulnerable_subdomains.append(result)
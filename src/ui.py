@@ -1,6 +1,7 @@
 import sys
 import shutil
 import time
+from functools import lru_cache
 
 LIGHT_BLUE = (179, 205, 224)
 BLUE = (0, 91, 150)
@@ -12,84 +13,97 @@ YELLOW = (241, 196, 15)
 GREY = (50, 50, 50)
 
 
-def whole_line():
-    return " " * shutil.get_terminal_size().columns
+CLEAR_LINE = "\033[2K\r"
 
 
-def gradient_text(text, start_color=LIGHT_BLUE, end_color=BLUE, like=None):
-    if not sys.stdout.isatty():
-        return text
-    
-    result = ""
-    length = len(text)
-    gradient_length = like if like is not None else length
-    
-    for i, char in enumerate(text):
+def clear_line():
+    if sys.stdout.isatty():
+        sys.stdout.write(CLEAR_LINE)
+
+
+@lru_cache(maxsize=256)
+def gradient_prefixes(start_color, end_color, length, gradient_length):
+    prefixes = []
+    for i in range(length):
         ratio = i / max(gradient_length - 1, 1)
         r = int(start_color[0] + ratio * (end_color[0] - start_color[0]))
         g = int(start_color[1] + ratio * (end_color[1] - start_color[1]))
         b = int(start_color[2] + ratio * (end_color[2] - start_color[2]))
-        result += f"\033[38;2;{r};{g};{b}m{char}"
-    result += "\033[0m"
-    return result
+        prefixes.append(f"\033[38;2;{r};{g};{b}m")
+    return tuple(prefixes)
 
 
-def colored_text(text, foreground_color, background_color=None):
+@lru_cache(maxsize=1024)
+def render_gradient(text, start_color, end_color, gradient_length):
+    prefixes = gradient_prefixes(start_color, end_color, len(text), gradient_length)
+    return "".join(p + c for p, c in zip(prefixes, text)) + "\033[0m"
+
+
+def gradient_text(text, start_color=LIGHT_BLUE, end_color=BLUE, like=None):
     if not sys.stdout.isatty():
-        return str(text)
+        return text
     
+    gradient_length = like if like is not None else len(text)
+    return render_gradient(text, start_color, end_color, gradient_length)
+
+
+@lru_cache(maxsize=64)
+def color_prefix(foreground_color, background_color=None):
     r, g, b = foreground_color
     if background_color:
         bg_r, bg_g, bg_b = background_color
-        return f"\033[38;2;{r};{g};{b}m\033[48;2;{bg_r};{bg_g};{bg_b}m{text}\033[0m"
-    else:
-        return f"\033[38;2;{r};{g};{b}m{text}\033[0m"
+        return f"\033[38;2;{r};{g};{b}m\033[48;2;{bg_r};{bg_g};{bg_b}m"
+    return f"\033[38;2;{r};{g};{b}m"
+
+
+def colored_text(text, foreground_color, background_color=None):
+    if not sys.stdout.isatty():
+        return str(text)
+    
+    return f"{color_prefix(foreground_color, background_color)}{text}\033[0m"
+
 
+STATUS_COLORS = (None, None, GREEN, YELLOW, LIGHT_BLUE, SPIDER_RED)
+SIZE_UNITS = ("bytes", "KB", "MB", "GB")
 
+
+@lru_cache(maxsize=None)
 def colorize_status(status):
-    if 200 <= status < 300:
-        return f"[{colored_text(status, GREEN)}]"
-    elif 300 <= status < 400:
-        return f"[{colored_text(status, YELLOW)}]"
-    elif 400 <= status < 500:
-        return f"[{colored_text(status, LIGHT_BLUE)}]"
-    elif 500 <= status < 600:
-        return f"[{colored_text(status, SPIDER_RED)}]"
-    else:
+    color = STATUS_COLORS[status // 100] if 0 <= status < 600 else None
+    if color is None:
         return f"[{status}]"
+    return f"[{colored_text(status, color)}]"
 
 def format_bytes(bytes_count):
     """
     Formate un nombre d'octets en une chaîne lisible (bytes, KB, MB, etc.)
     """
-    if bytes_count < 1024:
+    unit = min(max(bytes_count.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    if unit == 0:
         return f"{bytes_count} bytes"
-    elif bytes_count < 1024 * 1024:
-        return f"{bytes_count / 1024:.1f} KB"
-    elif bytes_count < 1024 * 1024 * 1024:
-        return f"{bytes_count / (1024 * 1024):.1f} MB"
-    else:
-        return f"{bytes_count / (1024 * 1024 * 1024):.1f} GB"
+    return f"{bytes_count / (1 << (10 * unit)):.1f} {SIZE_UNITS[unit]}"
 
 def format_time(seconds):
     if seconds < 60:
         return f"{int(seconds)}s"
-    elif seconds < 3600:
-        mins = int(seconds / 60)
-        secs = int(seconds % 60)
+    mins, secs = divmod(int(seconds), 60)
+    if mins < 60:
         return f"{mins}m {secs}s"
-    else:
-        hours = int(seconds / 3600)
-        mins = int((seconds % 3600) / 60)
-        return f"{hours}h {mins}m"
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins}m"
+
+
+@lru_cache(maxsize=128)
+def colored_bar(filled_length, bar_length):
+    bar_colored = gradient_text("━" * filled_length, start_color=LIGHT_BLUE, end_color=DARK_BLUE, like=bar_length)
+    bar_colored += colored_text("━" * (bar_length - filled_length), foreground_color=GREY)
+    return bar_colored
 
 
 def print_progress_bar(current, total, start_time, bar_length=40):
     if not sys.stdout.isatty():
         return
     
-    ERASE_LINE = "\033[K"
-    
     percentage = (current / total * 100) if total > 0 else 0
     filled_length = int(bar_length * current / total) if total > 0 else 0
     
@@ -102,18 +116,16 @@ def print_progress_bar(current, total, start_time, bar_length=40):
     else:
         eta_str = "calculating..."
     
-    bar_chars = "━" * filled_length + "━" * (bar_length - filled_length)
-    bar_colored = gradient_text("━" * filled_length, start_color=LIGHT_BLUE, end_color=DARK_BLUE, like=bar_length)
-    bar_colored += colored_text("━" * (bar_length - filled_length), foreground_color=GREY)
-    
-    progress_text = f"{bar_colored} {percentage:.1f}% ({current}/{total}) | ETA: {eta_str}"
+    stats_text = f" {percentage:.1f}% ({current}/{total}) | ETA: {eta_str}"
+    progress_text = colored_bar(filled_length, bar_length) + stats_text
     
     terminal_width = shutil.get_terminal_size().columns
-    if len(f"{bar_chars} {percentage:.1f}% ({current}/{total}) | ETA: {eta_str}") > terminal_width:
+    if bar_length + len(stats_text) > terminal_width:
         max_len = terminal_width - 4
         progress_text = progress_text[:max_len] + "..."
     
-    print(f"\r{ERASE_LINE}{progress_text}", end="", flush=True)
+    sys.stdout.write(CLEAR_LINE + progress_text)
+    sys.stdout.flush()
 
 
 def print_status_line(text):
@@ -1,72 +1,198 @@
+import os
 import sys
+import json
+import time
+import errno
 import shutil
-import tempfile
-import zipfile
+import tarfile
 import subprocess
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from urllib.error import HTTPError
 from urllib.request import urlopen, Request
 
 GITHUB_USER = "b3rt1ng"
 GITHUB_REPO = "SubLing"
-GITHUB_ARCHIVE_URL = f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/archive/refs/heads/main.zip"
+GITHUB_ARCHIVE_URL = f"https://github.com/{GITHUB_USER}/{GITHUB_REPO}/archive/refs/heads/main.tar.gz"
+GITHUB_VERSION_URL = f"https://raw.githubusercontent.com/{GITHUB_USER}/{GITHUB_REPO}/refs/heads/main/version.txt"
+
+ITEMS_TO_UPDATE = ('src', 'data', 'main.py', 'install.py', 'requirements.txt', 'version.txt', 'README.md')
+COPY_BUFFER_SIZE = 1 << 20
+PROGRESS_STEP = 256 * 1024
+VERSION_CACHE_TTL = 300
+LINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP})
 
 
 def get_current_version(project_root):
-    version_file = project_root / "version.txt"
     try:
-        if version_file.exists():
-            return version_file.read_text().strip()
+        return (project_root / "version.txt").read_text().strip()
+    except FileNotFoundError:
         return "unknown"
-    except Exception as e:
+    except OSError as e:
         print(f"Error reading version file: {e}")
         return "unknown"
 
 
+def version_cache_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "subling" / "version_etag.json"
+
+
+def load_version_cache():
+    try:
+        with open(version_cache_path(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_version_cache(cache):
+    cache_path = version_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def get_latest_version():
-    version_url = f"https://raw.githubusercontent.com/{GITHUB_USER}/{GITHUB_REPO}/refs/heads/main/version.txt"
+    cache = load_version_cache()
+    cached_version = cache.get("value")
+    if cached_version and time.time() - cache.get("fetched_at", 0) < VERSION_CACHE_TTL:
+        return cached_version
+    
     try:
-        req = Request(version_url)
+        req = Request(GITHUB_VERSION_URL)
         req.add_header('User-Agent', 'SubLing-Updater')
+        if cached_version:
+            if cache.get("etag"):
+                req.add_header('If-None-Match', cache["etag"])
+            if cache.get("last_modified"):
+                req.add_header('If-Modified-Since', cache["last_modified"])
+        
+        try:
+            with urlopen(req, timeout=10) as response:
+                cache = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "value": response.read().decode().strip(),
+                }
+        except HTTPError as e:
+            if e.code != 304 or not cached_version:
+                raise
         
-        with urlopen(req, timeout=10) as response:
-            return response.read().decode().strip()
+        cache["fetched_at"] = time.time()
+        save_version_cache(cache)
+        return cache["value"]
     except Exception as e:
         print(f"Error fetching latest version: {e}")
         return None
 
 
-def download_latest_version(temp_dir):
+class DownloadStream:
+    def __init__(self, response):
+        self.response = response
+        self.total_size = int(response.headers.get('content-length', 0))
+        self.downloaded = 0
+        self.last_report = 0
+        self.finished = False
+    
+    def read(self, size=-1):
+        data = self.response.read(size)
+        self.downloaded += len(data)
+        if data:
+            if self.total_size > 0 and self.downloaded - self.last_report >= PROGRESS_STEP:
+                self.last_report = self.downloaded
+                sys.stdout.write(f"\r   Progress: {self.downloaded / self.total_size * 100:.1f}%")
+        elif not self.finished:
+            self.finished = True
+            if self.total_size > 0 and self.downloaded != self.last_report:
+                sys.stdout.write(f"\r   Progress: {self.downloaded / self.total_size * 100:.1f}%")
+            sys.stdout.flush()
+            print("\n✅ Download complete!")
+        return data
+    
+    def drain(self):
+        while self.read(COPY_BUFFER_SIZE):
+            pass
+    
+    def close(self):
+        self.response.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def download_latest_version():
     try:
         print("📥 Downloading latest version from GitHub...")
         req = Request(GITHUB_ARCHIVE_URL)
         req.add_header('User-Agent', 'SubLing-Updater')
+        req.add_header('Accept-Encoding', 'identity')
         
-        zip_path = Path(temp_dir) / "subling.zip"
-        
-        with urlopen(req, timeout=30) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            chunk_size = 8192
-            
-            with open(zip_path, 'wb') as f:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\r   Progress: {percent:.1f}%", end='', flush=True)
-        
-        print("\n✅ Download complete!")
-        return zip_path
+        return DownloadStream(urlopen(req, timeout=30))
     except Exception as e:
         print(f"\n❌ Error downloading update: {e}")
         return None
 
 
-def extract_and_update(zip_path, project_root):
+def update_member_parts(member, root):
+    parts = PurePosixPath(member.name).parts
+    if root and parts[:1] == (root,):
+        parts = parts[1:]
+    if not parts or parts[0] not in ITEMS_TO_UPDATE or '..' in parts:
+        return None
+    if not (member.isfile() or member.isdir()):
+        return None
+    return parts
+
+
+def copy_stream(src, dst, buffer):
+    while True:
+        read = src.readinto(buffer)
+        if not read:
+            break
+        dst.write(buffer[:read])
+
+
+def hardlink_tree(src, dst):
+    os.mkdir(dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir(follow_symlinks=False):
+                hardlink_tree(entry.path, target)
+            else:
+                try:
+                    os.link(entry.path, target, follow_symlinks=False)
+                except OSError as e:
+                    if e.errno not in LINK_FALLBACK_ERRNOS:
+                        raise
+                    shutil.copy2(entry.path, target)
+
+
+def swap_in_backup(project_root, backup_dir):
+    broken_dir = project_root.with_name(f"{project_root.name}_broken")
+    if broken_dir.exists():
+        shutil.rmtree(broken_dir)
+    
+    os.rename(project_root, broken_dir)
+    try:
+        os.rename(backup_dir, project_root)
+    except OSError:
+        os.rename(broken_dir, project_root)
+        raise
+    shutil.rmtree(broken_dir, ignore_errors=True)
+
+
+def extract_and_update(archive, project_root):
     try:
         print("📦 Extracting update...")
         
@@ -75,37 +201,44 @@ def extract_and_update(zip_path, project_root):
             shutil.rmtree(backup_dir)
         
         print("💾 Creating backup...")
-        shutil.copytree(project_root, backup_dir)
+        hardlink_tree(project_root, backup_dir)
         
-        with tempfile.TemporaryDirectory() as extract_dir:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            extracted_items = list(Path(extract_dir).iterdir())
-            if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                source_dir = extracted_items[0]
-            else:
-                source_dir = Path(extract_dir)
-            
-            items_to_update = ['src', 'data', 'main.py', 'install.py', 'version.txt', 'README.md']
-            
-            print("🔄 Applying update...")
-            for item_name in items_to_update:
-                source_item = source_dir / item_name
-                target_item = project_root / item_name
+        print("🔄 Applying update...")
+        updated = set()
+        root = None
+        buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+        with tarfile.open(fileobj=archive, mode='r|gz', bufsize=COPY_BUFFER_SIZE) as tar_ref:
+            for member in tar_ref:
+                if root is None:
+                    name = member.name.rstrip('/')
+                    root = name if member.isdir() and '/' not in name else ""
                 
-                if source_item.exists():
+                parts = update_member_parts(member, root)
+                if parts is None:
+                    continue
+                
+                if parts[0] not in updated:
+                    target_item = project_root / parts[0]
                     if target_item.exists():
                         if target_item.is_dir():
                             shutil.rmtree(target_item)
                         else:
                             target_item.unlink()
-                    
-                    if source_item.is_dir():
-                        shutil.copytree(source_item, target_item)
-                    else:
-                        shutil.copy2(source_item, target_item)
-                    print(f"   ✓ Updated: {item_name}")
+                    updated.add(parts[0])
+                
+                target = project_root.joinpath(*parts)
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with tar_ref.extractfile(member) as src, open(target, 'wb') as dst:
+                    copy_stream(src, dst, buffer)
+        archive.drain()
+        
+        for item_name in ITEMS_TO_UPDATE:
+            if item_name in updated:
+                print(f"   ✓ Updated: {item_name}")
         
         print("\n✅ Update applied successfully!")
         print(f"💾 Backup saved at: {backup_dir}")
@@ -116,18 +249,21 @@ def extract_and_update(zip_path, project_root):
         print("🔙 Attempting to restore from backup...")
         try:
             if backup_dir.exists():
-                for item in project_root.iterdir():
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-                
-                for item in backup_dir.iterdir():
-                    target = project_root / item.name
-                    if item.is_dir():
-                        shutil.copytree(item, target)
-                    else:
-                        shutil.copy2(item, target)
+                try:
+                    swap_in_backup(project_root, backup_dir)
+                except OSError:
+                    for item in project_root.iterdir():
+                        if item.is_dir():
+                            shutil.rmtree(item)
+                        else:
+                            item.unlink()
+                    
+                    for item in backup_dir.iterdir():
+                        target = project_root / item.name
+                        if item.is_dir():
+                            shutil.copytree(item, target)
+                        else:
+                            shutil.copy2(item, target)
                 
                 print("✅ Backup restored successfully!")
         except Exception as restore_error:
@@ -189,26 +325,26 @@ def check_and_update(project_root):
         print("\nUpdate cancelled.")
         return False
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        zip_path = download_latest_version(temp_dir)
-        if zip_path is None:
-            return False
-        
-        success = extract_and_update(zip_path, project_root)
+    archive = download_latest_version()
+    if archive is None:
+        return False
+    
+    with archive:
+        success = extract_and_update(archive, project_root)
+    
+    if success:
+        new_version = get_current_version(project_root)
+        print(f"\n🎉 Successfully updated to version {new_version}!")
         
-        if success:
-            new_version = get_current_version(project_root)
-            print(f"\n🎉 Successfully updated to version {new_version}!")
-            
-            install_success = run_install_script(project_root)
-            
-            if install_success:
-                print("\n✨ Update and installation complete! SubLing is ready to use.")
-            else:
-                print("\n⚠️  Update complete but installation had issues.")
-                print("You may need to run 'python install.py' manually.")
+        install_success = run_install_script(project_root)
         
-        return success
+        if install_success:
+            print("\n✨ Update and installation complete! SubLing is ready to use.")
+        else:
+            print("\n⚠️  Update complete but installation had issues.")
+            print("You may need to run 'python install.py' manually.")
+    
+    return success
 
 
 def update_command(project_root):
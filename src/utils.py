@@ -1,41 +1,110 @@
-from typing import List, Dict, Optional, Tuple
+import mmap
+import os
+import re
+import stat
+from operator import itemgetter
+from typing import BinaryIO, Iterable, Iterator, Optional, Set, Tuple
 
-def load_wordlist(filepath: str) -> List[str]:
+COUNT_CHUNK_SIZE = 1 << 20
+WRITE_BUFFER_SIZE = 1 << 20
+
+VALID_LABELS = re.compile(rb"(?!-)[a-z0-9-]{1,63}(?<!-)(?:\.(?!-)[a-z0-9-]{1,63}(?<!-))*")
+
+
+def filter_words(lines: Iterable[bytes], seen: Set[bytes]) -> Iterator[str]:
+    for word in map(bytes.strip, lines):
+        if word in seen or not VALID_LABELS.fullmatch(word):
+            continue
+        seen.add(word)
+        yield word.decode("ascii")
+
+
+def iter_wordlist(mm: mmap.mmap) -> Iterator[str]:
+    seen = set()
+    tail = b""
+    try:
+        size = len(mm)
+        for start in range(0, size, COUNT_CHUNK_SIZE):
+            lines = (tail + mm[start:start + COUNT_CHUNK_SIZE]).lower().split(b"\n")
+            tail = lines.pop() if start + COUNT_CHUNK_SIZE < size else b""
+            yield from filter_words(lines, seen)
+    finally:
+        mm.close()
+
+
+def iter_stream_wordlist(f: BinaryIO) -> Iterator[str]:
+    try:
+        yield from filter_words(map(bytes.lower, f), set())
+    finally:
+        f.close()
+
+
+def load_wordlist(filepath: str) -> Tuple[int, Iterator[str]]:
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            words = [line.strip() for line in f if line.strip()]
+        f = open(filepath, "rb")
     except FileNotFoundError:
         raise FileNotFoundError(f"Wordlist not found: {filepath}")
-    
-    if not words:
-        raise ValueError(f"Wordlist is empty: {filepath}")
-    
-    return words
+
+    if not stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+        return 0, iter_stream_wordlist(f)
+
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Wordlist is empty: {filepath}")
+
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    size = len(mm)
+    total = sum(
+        mm[start:start + COUNT_CHUNK_SIZE].count(b"\n")
+        for start in range(0, size, COUNT_CHUNK_SIZE)
+    )
+    if mm[size - 1:size] != b"\n":
+        total += 1
+
+    return total, iter_wordlist(mm)
+
+
+def format_result(
+    subdomain: str,
+    proto: Optional[str],
+    status: Optional[int],
+    ip: Optional[str],
+    size: Optional[int]
+) -> str:
+    base = ""
+    if proto:
+        base = f"{subdomain} [{proto}] [{status}]"
+    else:
+        base = f"{subdomain} [DNS]"
+    if ip:
+        base += f" [{ip}]"
+    if size is not None:
+        if size < 1024:
+            size_str = f"{size} bytes"
+        elif size < 1024 * 1024:
+            size_str = f"{size / 1024:.1f} KB"
+        else:
+            size_str = f"{size / (1024 * 1024):.1f} MB"
+        base += f" [{size_str}]"
+    return f"{base}\n"
 
 
 def save_results(
     output_file: str,
-    found_subdomains: Dict[str, Tuple[Optional[str], Optional[int], Optional[str], Optional[int]]]
+    found_subdomains: Iterable[Tuple[str, Optional[str], Optional[int], Optional[str], Optional[int]]]
 ) -> None:
     try:
-        with open(output_file, 'w') as f:
-            for subdomain, (proto, status, ip, size) in sorted(found_subdomains.items()):
-                base = ""
-                if proto:
-                    base = f"{subdomain} [{proto}] [{status}]"
-                else:
-                    base = f"{subdomain} [DNS]"
-                if ip:
-                    base += f" [{ip}]"
-                if size is not None:
-                    if size < 1024:
-                        size_str = f"{size} bytes"
-                    elif size < 1024 * 1024:
-                        size_str = f"{size / 1024:.1f} KB"
-                    else:
-                        size_str = f"{size / (1024 * 1024):.1f} MB"
-                    base += f" [{size_str}]"
-                f.write(f"{base}\n")
+        lines = [
+            (subdomain, format_result(subdomain, proto, status, ip, size))
+            for subdomain, proto, status, ip, size in found_subdomains
+        ]
+        lines.sort(key=itemgetter(0))
+        with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write("".join(map(itemgetter(1), lines)))
     except Exception as e:
         raise IOError(f"Error saving results: {e}")
 
@@ -47,4 +116,4 @@ def validate_domain(domain: str) -> bool:
     if ' ' in domain or '.' not in domain or len(domain) > 253:
         return False
     
-    return True
\ No newline at end of file
+    return True
@@ -1,10 +1,21 @@
+import dns.asyncquery
+import dns.asyncresolver
 import dns.resolver
-import dns.query
 import dns.zone
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
 import asyncio
+import time
 from .ui import gradient_text, colored_text, print_report_box, GREEN, SPIDER_RED, YELLOW
 
+NAMESERVER_CACHE_TTL = 300
+_nameserver_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+
+@lru_cache(maxsize=1)
+def get_zone_resolver() -> dns.asyncresolver.Resolver:
+    return dns.asyncresolver.Resolver(configure=True)
+
 
 class ZoneTransferDetector:
     
@@ -14,34 +25,33 @@ class ZoneTransferDetector:
         self.nameservers: List[str] = []
         self.vulnerable_ns: List[str] = []
         
+    async def resolve_nameserver(self, resolver: dns.asyncresolver.Resolver, ns_name: str) -> List[str]:
+        try:
+            ns_answers = await resolver.resolve(ns_name, 'A', lifetime=self.timeout)
+            return [str(ns_ip.address) for ns_ip in ns_answers]
+        except Exception:
+            return [ns_name]
+    
     async def get_nameservers(self) -> List[str]:
+        cached = _nameserver_cache.get(self.domain)
+        if cached and time.monotonic() - cached[0] < NAMESERVER_CACHE_TTL:
+            self.nameservers = list(cached[1])
+            return self.nameservers
+        
         try:
-            loop = asyncio.get_event_loop()
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = self.timeout
-            resolver.lifetime = self.timeout
+            resolver = get_zone_resolver()
             
-            answers = await loop.run_in_executor(
-                None,
-                lambda: resolver.resolve(self.domain, 'NS')
-            )
+            answers = await resolver.resolve(self.domain, 'NS', lifetime=self.timeout)
             
-            nameservers = []
-            for rdata in answers:
-                ns_name = str(rdata.target).rstrip('.')
-                
-                try:
-                    ns_answers = await loop.run_in_executor(
-                        None,
-                        lambda name=ns_name: resolver.resolve(name, 'A')
-                    )
-                    for ns_ip in ns_answers:
-                        nameservers.append(str(ns_ip.address))
-                except Exception:
-                    nameservers.append(ns_name)
+            resolved = await asyncio.gather(*(
+                self.resolve_nameserver(resolver, str(rdata.target).rstrip('.'))
+                for rdata in answers
+            ))
             
-            self.nameservers = nameservers
-            return nameservers
+            nameservers = [address for addresses in resolved for address in addresses]
+            _nameserver_cache[self.domain] = (time.monotonic(), nameservers)
+            self.nameservers = list(nameservers)
+            return self.nameservers
             
         except dns.resolver.NXDOMAIN:
             print(colored_text("   ❌ Domain does not exist (NXDOMAIN)", SPIDER_RED))
@@ -58,25 +68,25 @@ class ZoneTransferDetector:
     
     async def attempt_axfr(self, nameserver: str) -> Optional[Set[str]]:
         try:
-            loop = asyncio.get_event_loop()
-            
-            zone = await loop.run_in_executor(
-                None,
-                lambda: dns.zone.from_xfr(
-                    dns.query.xfr(nameserver, self.domain, timeout=self.timeout)
-                )
+            zone = dns.zone.Zone(self.domain)
+            await dns.asyncquery.inbound_xfr(
+                nameserver,
+                zone,
+                timeout=self.timeout,
+                lifetime=self.timeout
             )
             
             subdomains = set()
-            for name, node in zone.nodes.items():
-                subdomain = str(name)
+            add = subdomains.add
+            domain = self.domain
+            suffix = f".{domain}".rstrip('.')
+            for name in zone.nodes:
+                subdomain = name.to_text()
                 if subdomain == '@':
-                    subdomains.add(self.domain)
+                    add(domain)
                 elif subdomain:
-                    full_domain = f"{subdomain}.{self.domain}".rstrip('.')
-                    subdomains.add(full_domain)
+                    add(subdomain + suffix)
             
-            self.vulnerable_ns.append(nameserver)
             return subdomains
         except:
             return None
@@ -93,16 +103,22 @@ class ZoneTransferDetector:
         
         all_subdomains = set()
         
-        for ns in self.nameservers:
-            print(f"   • Trying AXFR on {ns}...", end=" ", flush=True)
-            
-            subdomains = await self.attempt_axfr(ns)
+        results = await asyncio.gather(
+            *(self.attempt_axfr(ns) for ns in self.nameservers),
+            return_exceptions=True
+        )
+        
+        vulnerable_label = colored_text("✓ VULNERABLE!", SPIDER_RED)
+        protected_label = colored_text("✗ Protected", GREEN)
+        for ns, subdomains in zip(self.nameservers, results):
+            print(f"   • Trying AXFR on {ns}...", end=" ")
             
-            if subdomains:
-                print(colored_text("✓ VULNERABLE!", SPIDER_RED))
+            if subdomains and not isinstance(subdomains, BaseException):
+                print(vulnerable_label)
+                self.vulnerable_ns.append(ns)
                 all_subdomains.update(subdomains)
             else:
-                print(colored_text("✗ Protected", GREEN))
+                print(protected_label)
         
         if all_subdomains:
             return all_subdomains